@@ -15,6 +15,7 @@ from ..connectors.cex_ccxt import ExchangeConnector
 from ..core.config import StrategyConfig, load_venues_config
 from ..core.events import EventBus
 from ..core.metrics import MetricsCollector, MetricsService
+from ..core.symbol_table import SymbolTable
 from ..core.utils import load_exchange_credentials
 from ..data.feeds import (
     InMemoryFeedStore,
@@ -30,23 +31,31 @@ from ..mm.quoter import Quoter
 from ..risk.kill_switch import KillSwitch
 from ..risk.limits import RiskLimits, SymbolLimits
 from ..risk.orphan_reaper import OrphanReaper
+from ..signals.fused import SnapshotFeatures
 from ..signals.impact import ImpactEstimator
 from ..signals.microstructure import MicrostructureSignals
 from ..signals.volatility import VolatilityEstimator
+from ..signals.warmup import warmup
 
 logger = logging.getLogger("bot")
 
 
 async def _run(config_path: Path, paper: bool) -> None:
     config = StrategyConfig.load(config_path)
+    # Pay any numba compile / cache load now rather than on the first snapshot. This
+    # blocks, so it runs before anything (e.g. the metrics endpoint) is serving.
+    warmup()
     collector = MetricsCollector()
     metrics_service = MetricsService(collector, config.metrics.host, config.metrics.port)
     await metrics_service.start()
     bus = EventBus()
     store = InMemoryFeedStore()
-    micro = MicrostructureSignals()
-    vol = VolatilityEstimator()
-    impact = ImpactEstimator()
+    # One id space for every estimator so a symbol sits on the same row everywhere.
+    symbols = SymbolTable()
+    micro = MicrostructureSignals(symbols=symbols)
+    vol = VolatilityEstimator(symbols=symbols)
+    features = SnapshotFeatures(micro, vol)
+    impact = ImpactEstimator(symbols=symbols)
     last_trade_price: Dict[str, float] = {}
 
     storage = await create_storage(config.storage.backend, config.storage.dsn)
@@ -99,8 +108,7 @@ async def _run(config_path: Path, paper: bool) -> None:
     kill_switch = KillSwitch(config.risk.kill_switch_threshold, on_kill)
 
     async def handle_snapshot(snapshot) -> None:
-        micro.update_snapshot(snapshot)
-        vol.update(snapshot)
+        features.update_snapshot(snapshot)
 
     async def handle_trade(trade) -> None:
         micro.update_trade(trade)
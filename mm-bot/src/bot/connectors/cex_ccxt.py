@@ -7,7 +7,7 @@ import contextlib
 import datetime as dt
 import itertools
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set
 
 try:  # pragma: no cover - optional dependency for tests
@@ -71,7 +71,7 @@ class PaperExchange:
 
     async def place_order(self, order: Order) -> str:
         order_id = f"paper-{next(self._order_id)}"
-        new_order = Order(**{**order.__dict__, "order_id": order_id})
+        new_order = replace(order, order_id=order_id)
         async with self._lock:
             self._orders[order_id] = OrderState(order=new_order, remaining=new_order.size)
         return order_id
@@ -0,0 +1,41 @@
+"""Dense integer ids for symbol names."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+
+class SymbolTable:
+    """Assign each symbol a stable, dense integer id.
+
+    Sharing one table between estimators means a symbol maps to the same row in every
+    per-symbol state array.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._ids
+
+    def intern(self, symbol: str) -> int:
+        """Return the id for ``symbol``, assigning the next free one on first sight."""
+
+        idx = self._ids.get(symbol)
+        if idx is None:
+            idx = self._ids[symbol] = len(self._names)
+            self._names.append(symbol)
+        return idx
+
+    def get(self, symbol: str) -> Optional[int]:
+        return self._ids.get(symbol)
+
+    def name(self, idx: int) -> str:
+        return self._names[idx]
+
+
+__all__ = ["SymbolTable"]
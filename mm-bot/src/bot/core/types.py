@@ -13,6 +13,12 @@ class Side(str, Enum):
     BUY = "buy"
     SELL = "sell"
 
+    sign: float
+
+    def __init__(self, value: str) -> None:
+        # +1.0 / -1.0 multiplier for signed sizes; a plain attribute keeps hot paths branch-free.
+        self.sign = 1.0 if value == "buy" else -1.0
+
     @property
     def opposite(self) -> "Side":
         return Side.SELL if self is Side.BUY else Side.BUY
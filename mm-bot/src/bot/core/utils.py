@@ -21,9 +21,12 @@ def clamp(value: float, minimum: float, maximum: float) -> float:
     return max(minimum, min(maximum, value))
 
 
+def jittered(base: float, jitter: float = 0.1) -> float:
+    return max(base + random.uniform(-jitter, jitter), 0.0)
+
+
 async def jitter_sleep(base: float, jitter: float = 0.1) -> None:
-    wait = base + random.uniform(-jitter, jitter)
-    await asyncio.sleep(max(wait, 0.0))
+    await asyncio.sleep(jittered(base, jitter))
 
 
 def ewma(values: Iterable[float], alpha: float) -> float:
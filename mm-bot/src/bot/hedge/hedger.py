@@ -63,8 +63,7 @@ class Hedger:
                     break
                 if fill.order_id != order_id:
                     continue
-                delta = fill.size if fill.side == Side.BUY else -fill.size
-                executed_delta += delta
+                executed_delta += fill.size * fill.side.sign
                 self.last_notional += abs(fill.price * fill.size)
 
         if slices > 1:
@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
-import math
 from dataclasses import dataclass, field
 from typing import Dict, Optional, Protocol
 
 from ..connectors.cex_ccxt import ExchangeConnector, OrderState
 from ..core.types import Order, OrderBookSnapshot, Side, Trade
-from ..core.utils import jitter_sleep
+from ..core.utils import jittered
 from ..data.feeds import InMemoryFeedStore
 from ..data.storage import StorageBackend
 from ..models.avellaneda_stoikov import AvellanedaStoikovModel, QuoteResult
@@ -24,6 +24,8 @@ from ..hedge.hedger import Hedger
 
 
 class MetricsRecorder(Protocol):
+    hedge_notional: float
+
     def record(self, symbol: str, inventory: float, pnl: float, spread: float) -> None:  # pragma: no cover - interface
         ...
 
@@ -56,6 +58,7 @@ class Quoter:
         symbol: str,
         metrics: Optional[MetricsRecorder] = None,
         kill_switch: Optional[KillSwitch] = None,
+        orphan_interval: float = 1.0,
     ) -> None:
         self._store = store
         self._connector = connector
@@ -66,32 +69,43 @@ class Quoter:
         self._impact = impact
         self._hedger = hedger
         self._orphan = orphan
+        self._orphan_interval = orphan_interval
         self._storage = storage
         self._refresh = refresh
         self._lot_size = lot_size
         self._tick_size = tick_size
+        self._half_tick = tick_size * 0.5
+        # Partial fill sizes rarely sum back to the order size exactly in floating point.
+        self._fill_epsilon = lot_size * 1e-9
         self._venue = venue
         self._symbol = symbol
         self._state = SymbolState()
+        # Held while this quoter places orders, so the sync never mistakes one still in
+        # flight (not yet in ``open_orders``) for a stray.
+        self._orders_lock = asyncio.Lock()
         self._running = False
         self._metrics = metrics
         self._kill_switch = kill_switch
         self._logger = logging.getLogger(f"Quoter[{symbol}]")
+        self._log_error = self._logger.error
         self._connector.register_symbol(symbol)
+        self._micro.register_symbol(symbol)
+        self._vol.register_symbol(symbol)
+        self._impact.register_symbol(symbol)
 
     async def start(self) -> None:
         self._running = True
+        orphan_task = asyncio.create_task(self._orphan_loop())
+        halt_task = asyncio.create_task(self._wait_for_halt())
         try:
             while self._running:
-                if self._risk.halted:
-                    self._logger.warning("risk halted for %s: %s", self._symbol, self._risk.halted_reason)
-                    await self._cancel_all()
-                    await asyncio.sleep(1.0)
-                    break
-                if self._kill_switch and self._kill_switch.tripped:
-                    self._logger.error("kill switch tripped: %s", self._kill_switch.reason)
-                    await self._cancel_all()
-                    break
+                if halt_task.done():
+                    if self._halted():
+                        await self._handle_halt()
+                        break
+                    # Tripped and reset before we got here: keep quoting and re-arm the watcher.
+                    self._logger.warning("halt cleared before it was handled; resuming quoting")
+                    halt_task = asyncio.create_task(self._wait_for_halt())
                 try:
                     snapshot = await self._store.get_snapshot(self._symbol)
                     if snapshot is None:
@@ -119,78 +133,151 @@ class Quoter:
                     await self._connector.process_cross(self._symbol, snapshot.bid.price, snapshot.ask.price)
                     await self._drain_fills(snapshot)
                     if self._risk.halted:
-                        continue
-                    hedged_inventory = await self._hedger.maybe_hedge(
-                        snapshot, self._state.inventory, self._tick_size, self._lot_size
-                    )
+                        await self._handle_halt()
+                        break
+                    async with self._orders_lock:
+                        hedged_inventory = await self._hedger.maybe_hedge(
+                            snapshot, self._state.inventory, self._tick_size, self._lot_size
+                        )
                     self._state.inventory = hedged_inventory
                     self._risk.update_inventory(self._symbol, self._state.inventory)
                     if self._metrics:
                         self._metrics.record(
                             self._symbol, self._state.inventory, self._state.pnl, quote.spread
                         )
-                        self._metrics.hedge_notional = getattr(self._hedger, "last_notional", 0.0)
-                    await self._orphan.sweep()
+                        self._metrics.hedge_notional = self._hedger.last_notional
                 except Exception as exc:
-                    self._logger.exception("error in quoting loop: %s", exc)
-                    if self._kill_switch:
-                        await self._kill_switch.record_error(str(exc))
+                    await self._record_error("error in quoting loop: %r", exc)
                     await asyncio.sleep(min(self._refresh, 1.0))
-                await jitter_sleep(self._refresh)
+                # Sleep until the next refresh, waking early if risk or the kill switch halts.
+                await asyncio.wait((halt_task,), timeout=jittered(self._refresh))
         finally:
+            for task in (halt_task, orphan_task):
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
             await self._cancel_all()
 
     async def stop(self) -> None:
         self._running = False
 
+    async def _wait_for_halt(self) -> None:
+        waiters = [asyncio.create_task(self._risk.wait_halted())]
+        if self._kill_switch is not None:
+            waiters.append(asyncio.create_task(self._kill_switch.wait_tripped()))
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    def _halted(self) -> bool:
+        kill_switch = self._kill_switch
+        return self._risk.halted or (kill_switch is not None and kill_switch.tripped)
+
+    async def _handle_halt(self) -> None:
+        if self._risk.halted:
+            self._logger.warning("risk halted for %s: %s", self._symbol, self._risk.halted_reason)
+            await self._cancel_all()
+            await asyncio.sleep(1.0)
+        elif self._kill_switch is not None and self._kill_switch.tripped:
+            self._logger.error("kill switch tripped: %s", self._kill_switch.reason)
+            await self._cancel_all()
+
+    async def _orphan_loop(self) -> None:
+        # The steps fail independently: a sweep stuck on an order the venue no longer
+        # knows must not stop the sync from dropping that order locally. Failures
+        # still count towards the kill switch, as they did inside the quoting loop.
+        steps = (
+            (self._orphan.sweep, "error sweeping orphan orders: %r"),
+            (self._sync_open_orders, "error syncing open orders: %r"),
+        )
+        while self._running:
+            for step, message in steps:
+                try:
+                    await step()
+                except asyncio.CancelledError:  # pragma: no cover - cooperative cancellation
+                    raise
+                except Exception as exc:
+                    await self._record_error(message, exc)
+            await asyncio.sleep(self._orphan_interval)
+
+    async def _sync_open_orders(self) -> None:
+        """Reconcile ``open_orders`` with the venue.
+
+        Tracked orders the venue no longer reports are dropped; live orders for the
+        symbol that are not tracked (e.g. left behind by a failed cancel) are cancelled.
+        """
+
+        async with self._orders_lock:
+            live = await self._connector.list_open_orders(symbol=self._symbol)
+            open_orders = self._state.open_orders
+            live_ids = {state.order.order_id for state in live}
+            for side, state in list(open_orders.items()):
+                if state.order.order_id not in live_ids:
+                    del open_orders[side]
+            tracked_ids = {state.order.order_id for state in open_orders.values()}
+            for state in live:
+                order_id = state.order.order_id
+                if order_id and order_id not in tracked_ids:
+                    await self._connector.cancel_order(order_id, symbol=self._symbol)
+
+    async def _record_error(self, message: str, exc: Exception) -> None:
+        self._report_error(message, exc)
+        if self._kill_switch:
+            await self._kill_switch.record_error(str(exc))
+
+    def _report_error(self, message: str, exc: Exception) -> None:
+        # Tracebacks are only rendered at DEBUG; exception storms at INFO+ stay cheap.
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._log_error(message, exc, exc_info=self._logger.isEnabledFor(logging.DEBUG))
+
     async def _replace_orders(self, quote: QuoteResult) -> None:
-        open_orders = await self._connector.list_open_orders(symbol=self._symbol)
-        desired_prices = {Side.BUY: quote.bid, Side.SELL: quote.ask}
-        active_sides: Dict[Side, OrderState] = {}
-        for state in open_orders:
-            target = desired_prices[state.order.side]
-            if math.isclose(state.order.price, target, abs_tol=self._tick_size / 2):
-                active_sides[state.order.side] = state
-                continue
-            if state.order.order_id:
-                await self._connector.cancel_order(state.order.order_id, symbol=self._symbol)
-                self._risk.record_cancel(self._symbol)
-        self._state.open_orders = active_sides
-        for side, price in desired_prices.items():
-            if side in active_sides:
-                continue
-            order = Order(
-                venue=self._venue,
-                symbol=self._symbol,
-                side=side,
-                price=price,
-                size=self._lot_size,
-                post_only=True,
-            )
-            if not self._risk.check_order(order):
-                continue
-            order_id = await self._connector.place_order(order)
-            await self._orphan.track(order_id)
-            order_with_id = Order(
-                venue=order.venue,
-                symbol=order.symbol,
-                side=order.side,
-                price=order.price,
-                size=order.size,
-                order_id=order_id,
-                post_only=order.post_only,
-            )
-            self._state.open_orders[side] = OrderState(order=order_with_id, remaining=order.size)
+        async with self._orders_lock:
+            open_orders = self._state.open_orders
+            for side, price in ((Side.BUY, quote.bid), (Side.SELL, quote.ask)):
+                existing = open_orders.get(side)
+                if existing is not None:
+                    if abs(existing.order.price - price) <= self._half_tick:
+                        continue
+                    order_id = existing.order.order_id
+                    if order_id:
+                        # Only forget the order once the cancel went through; if it raises,
+                        # the order stays tracked and is retried on the next refresh.
+                        await self._connector.cancel_order(order_id, symbol=self._symbol)
+                        self._risk.record_cancel(self._symbol)
+                    if open_orders.get(side) is existing:
+                        del open_orders[side]
+                order = Order(
+                    venue=self._venue,
+                    symbol=self._symbol,
+                    side=side,
+                    price=price,
+                    size=self._lot_size,
+                    post_only=True,
+                )
+                if not self._risk.check_order(order):
+                    continue
+                order_id = await self._connector.place_order(order)
+                order.order_id = order_id
+                open_orders[side] = OrderState(order=order, remaining=order.size)
+                await self._orphan.track(order_id)
 
     async def _drain_fills(self, snapshot: OrderBookSnapshot) -> None:
         while True:
             fill = await self._connector.poll_fill()
             if fill is None:
                 break
-            pnl_delta = (snapshot.mid - fill.price) * (fill.size if fill.side == Side.SELL else -fill.size)
-            self._state.pnl += pnl_delta - fill.fee
-            self._state.inventory += fill.size if fill.side == Side.BUY else -fill.size
-            self._risk.record_fill(fill, snapshot.mid, pnl_delta - fill.fee)
+            signed_size = fill.size * fill.side.sign
+            net_pnl = (fill.price - snapshot.mid) * signed_size - fill.fee
+            self._state.pnl += net_pnl
+            self._state.inventory += signed_size
+            self._risk.record_fill(fill, snapshot.mid, net_pnl)
+            resting = self._state.open_orders.get(fill.side)
+            if resting is not None and resting.order.order_id == fill.order_id:
+                resting.remaining -= fill.size
+                if resting.remaining <= self._fill_epsilon:
+                    del self._state.open_orders[fill.side]
             await self._storage.record_trade(
                 Trade(
                     venue=fill.venue,
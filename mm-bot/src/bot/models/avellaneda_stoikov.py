@@ -6,7 +6,6 @@ import math
 from dataclasses import dataclass
 
 from ..core.types import OrderBookSnapshot
-from ..core.utils import snap
 from ..signals.microstructure import MicrostructureFeature
 
 
@@ -46,12 +45,14 @@ class AvellanedaStoikovModel:
         skew = self.skew_alpha * inventory
         skew += 0.5 * feature.order_flow_imbalance
         skew -= 0.5 * feature.queue_imbalance
-        if abs(impact_lambda) > 0.01:
-            half_spread *= min(2.0, 1 + abs(impact_lambda))
+        impact = abs(impact_lambda)
+        if impact > 0.01:
+            half_spread *= 2.0 if impact > 1.0 else 1 + impact
         bid = reservation - half_spread - skew
         ask = reservation + half_spread + skew
         spread = max(ask - bid, min_tick_spread)
         mid = (bid + ask) / 2
-        bid = snap(mid - spread / 2, tick_size)
-        ask = snap(mid + spread / 2, tick_size)
+        # Inlined core.utils.snap: tick_size is validated positive by SymbolConfig.
+        bid = round((mid - spread / 2) / tick_size) * tick_size
+        ask = round((mid + spread / 2) / tick_size) * tick_size
         return QuoteResult(bid=bid, ask=ask, spread=ask - bid)
@@ -17,6 +17,7 @@ class KillSwitch:
         self._count = 0
         self._lock = asyncio.Lock()
         self._reason: Optional[str] = None
+        self._tripped_event = asyncio.Event()
 
     @property
     def tripped(self) -> bool:
@@ -26,6 +27,9 @@ class KillSwitch:
     def reason(self) -> Optional[str]:
         return self._reason
 
+    async def wait_tripped(self) -> None:
+        await self._tripped_event.wait()
+
     async def record_error(self, reason: str) -> None:
         async with self._lock:
             if self._reason is not None:
@@ -33,6 +37,7 @@ class KillSwitch:
             self._count += 1
             if self._count >= self._threshold:
                 self._reason = reason
+                self._tripped_event.set()
                 await self._on_trigger(reason)
                 self._count = 0
 
@@ -40,6 +45,7 @@ class KillSwitch:
         async with self._lock:
             self._count = 0
             self._reason = None
+            self._tripped_event.clear()
 
 
 __all__ = ["KillSwitch"]
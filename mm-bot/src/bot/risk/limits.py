@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-import datetime as dt
-from collections import deque
+import asyncio
+import time
 from dataclasses import dataclass, field
-from typing import Deque, Dict, Optional
+from typing import Dict, Final, Optional
 
-from ..core.types import Fill, Order, Side
+import numpy as np
+
+from ..core.types import Fill, Order
+
+_CANCEL_WINDOW_NS: Final = 60_000_000_000
 
 
 @dataclass(slots=True)
@@ -17,13 +21,71 @@ class SymbolLimits:
     max_cancels_per_minute: Optional[int] = None
 
 
+class _CancelWindow:
+    """Fixed-capacity ring of ``time.monotonic_ns()`` cancel timestamps.
+
+    ``head``/``tail`` are absolute counters (slot = counter % capacity). Timestamps are
+    appended in order, so the live span is sorted and stale entries are dropped with a
+    binary search instead of popping them one by one. Like ``deque(maxlen=...)`` the
+    oldest entry is overwritten once the ring is full.
+    """
+
+    __slots__ = ("_buf", "_capacity", "_head", "_tail")
+
+    def __init__(self, capacity: int = 1000) -> None:
+        self._buf = np.zeros(capacity, dtype=np.int64)
+        self._capacity = capacity
+        self._head = 0
+        self._tail = 0
+
+    def __len__(self) -> int:
+        return self._head - self._tail
+
+    def append(self, ts: int) -> None:
+        head = self._head
+        self._buf[head % self._capacity] = ts
+        self._head = head + 1
+        if self._head - self._tail > self._capacity:
+            self._tail += 1
+
+    def prune(self, cutoff: int) -> int:
+        """Drop timestamps older than ``cutoff`` and return how many remain."""
+
+        count = self._head - self._tail
+        if not count:
+            return 0
+        buf = self._buf
+        start = self._tail % self._capacity
+        if buf[start] >= cutoff:
+            return count
+        end = start + count
+        if end <= self._capacity:
+            stale = int(np.searchsorted(buf[start:end], cutoff))
+        else:
+            stale = int(np.searchsorted(buf[start:], cutoff))
+            if stale == self._capacity - start:
+                stale += int(np.searchsorted(buf[: end - self._capacity], cutoff))
+        self._tail += stale
+        return count - stale
+
+
+@dataclass(slots=True)
+class _PerSymbolState:
+    """Everything the admission path needs for one symbol, behind a single lookup."""
+
+    limits: Optional[SymbolLimits]
+    inventory: float = 0.0
+    mid: float = 0.0
+    notional: float = 0.0
+    cancels: _CancelWindow = field(default_factory=_CancelWindow)
+
+
 @dataclass(slots=True)
 class RiskState:
-    inventory: Dict[str, float] = field(default_factory=dict)
-    mid_prices: Dict[str, float] = field(default_factory=dict)
+    rows: Dict[str, _PerSymbolState] = field(default_factory=dict)
     realized_pnl: float = 0.0
     peak_equity: float = 0.0
-    cancel_events: Dict[str, Deque[dt.datetime]] = field(default_factory=dict)
+    total_notional: float = 0.0
     halted_reason: Optional[str] = None
 
 
@@ -38,15 +100,18 @@ class RiskLimits:
         max_daily_loss: float,
         max_inventory_notional: float,
     ) -> None:
-        self._limits = limits
         self._state = RiskState(
-            inventory={symbol: 0.0 for symbol in limits},
-            mid_prices={symbol: 0.0 for symbol in limits},
-            cancel_events={symbol: deque(maxlen=1000) for symbol in limits},
+            rows={
+                symbol: _PerSymbolState(limits=symbol_limits)
+                for symbol, symbol_limits in limits.items()
+            }
         )
+        # The rows dict is never rebound, so alias it to skip the ``_state`` hop on hot paths.
+        self._rows: Final = self._state.rows
         self._max_drawdown = max_drawdown
         self._max_daily_loss = max_daily_loss
         self._max_inventory_notional = max_inventory_notional
+        self._halt_event = asyncio.Event()
 
     @property
     def halted(self) -> bool:
@@ -56,69 +121,89 @@ class RiskLimits:
     def halted_reason(self) -> Optional[str]:
         return self._state.halted_reason
 
+    async def wait_halted(self) -> None:
+        await self._halt_event.wait()
+
     def update_mid(self, symbol: str, mid: float) -> None:
-        self._state.mid_prices[symbol] = mid
-        self._evaluate_inventory_notional()
+        ps = self._symbol_state(symbol)
+        ps.mid = mid
+        self._update_inventory_notional(ps)
 
     def update_inventory(self, symbol: str, quantity: float) -> None:
-        self._state.inventory[symbol] = quantity
-        self._evaluate_inventory_notional()
+        ps = self._symbol_state(symbol)
+        ps.inventory = quantity
+        self._update_inventory_notional(ps)
 
     def check_order(self, order: Order) -> bool:
-        if self.halted:
+        if self._state.halted_reason is not None:
             return False
-        limits = self._limits[order.symbol]
-        projected = self._state.inventory[order.symbol] + (
-            order.size if order.side == Side.BUY else -order.size
-        )
-        if abs(projected) > limits.max_position:
+        symbol, side, price, size = order.symbol, order.side, order.price, order.size
+        ps = self._rows[symbol]
+        limits = ps.limits
+        if limits is None:
+            raise KeyError(symbol)
+        # Chained range checks instead of ``abs``: sizes are unsigned (direction lives in
+        # ``side``) and a non-positive notional means a bad price, so it is rejected too.
+        max_position = limits.max_position
+        if not -max_position <= ps.inventory + size * side.sign <= max_position:
             return False
-        notional = abs(order.price * order.size)
-        if notional > limits.max_order_notional:
+        if not 0.0 < price * size <= limits.max_order_notional:
+            return False
+        max_cancels = limits.max_cancels_per_minute
+        recent_cancels = ps.cancels.prune(time.monotonic_ns() - _CANCEL_WINDOW_NS)
+        if max_cancels is not None and recent_cancels >= max_cancels:
+            self._halt(f"cancel rate limit reached for {symbol}")
             return False
-        if limits.max_cancels_per_minute is not None:
-            cancels = self._state.cancel_events[order.symbol]
-            now = dt.datetime.utcnow()
-            while cancels and (now - cancels[0]).total_seconds() > 60:
-                cancels.popleft()
-            if len(cancels) >= limits.max_cancels_per_minute:
-                self._halt(f"cancel rate limit reached for {order.symbol}")
-                return False
         return True
 
     def record_cancel(self, symbol: str) -> None:
-        events = self._state.cancel_events[symbol]
-        events.append(dt.datetime.utcnow())
+        self._symbol_state(symbol).cancels.append(time.monotonic_ns())
 
     def record_fill(self, fill: Fill, mid_price: float, pnl_delta: float) -> None:
-        if self.halted:
+        state = self._state
+        if state.halted_reason is not None:
             return
-        delta = fill.size if fill.side == Side.BUY else -fill.size
-        self._state.inventory[fill.symbol] = self._state.inventory.get(fill.symbol, 0.0) + delta
-        self._state.mid_prices[fill.symbol] = mid_price
-        self._state.realized_pnl += pnl_delta
-        if self._state.realized_pnl > self._state.peak_equity:
-            self._state.peak_equity = self._state.realized_pnl
-        drawdown = self._state.peak_equity - self._state.realized_pnl
-        if drawdown > self._max_drawdown:
-            self._halt(f"drawdown {drawdown:.2f} exceeds {self._max_drawdown}")
-        if -self._state.realized_pnl > self._max_daily_loss:
-            self._halt(f"daily loss {self._state.realized_pnl:.2f} below -{self._max_daily_loss}")
-        self._evaluate_inventory_notional()
-
-    def _evaluate_inventory_notional(self) -> None:
-        total_notional = 0.0
-        for symbol, quantity in self._state.inventory.items():
-            mid = self._state.mid_prices.get(symbol, 0.0)
-            total_notional += abs(quantity * mid)
+        ps = self._symbol_state(fill.symbol)
+        ps.inventory += fill.size * fill.side.sign
+        ps.mid = mid_price
+        pnl = state.realized_pnl + pnl_delta
+        state.realized_pnl = pnl
+        peak = state.peak_equity
+        peak = state.peak_equity = peak if pnl < peak else pnl
+        if peak - pnl > self._max_drawdown or -pnl > self._max_daily_loss:
+            self._halt_on_pnl(pnl, peak)
+        self._update_inventory_notional(ps)
+
+    def _symbol_state(self, symbol: str) -> _PerSymbolState:
+        ps = self._rows.get(symbol)
+        if ps is None:
+            # Unconfigured symbols still count towards inventory notional.
+            ps = self._rows[symbol] = _PerSymbolState(limits=None)
+        return ps
+
+    def _update_inventory_notional(self, ps: _PerSymbolState) -> None:
+        # Only one symbol changed, so adjust the running total by its delta.
+        notional = abs(ps.inventory * ps.mid)
+        self._state.total_notional += notional - ps.notional
+        ps.notional = notional
+        total_notional = self._state.total_notional
         if total_notional > self._max_inventory_notional:
             self._halt(
                 f"inventory notional {total_notional:.2f} exceeds {self._max_inventory_notional}"
             )
 
+    def _halt_on_pnl(self, pnl: float, peak: float) -> None:
+        # Cold path: only reached once a PnL limit is breached, so the message is built here.
+        drawdown = peak - pnl
+        if drawdown > self._max_drawdown:
+            self._halt(f"drawdown {drawdown:.2f} exceeds {self._max_drawdown}")
+        else:
+            self._halt(f"daily loss {pnl:.2f} below -{self._max_daily_loss}")
+
     def _halt(self, reason: str) -> None:
         if self._state.halted_reason is None:
             self._state.halted_reason = reason
+            self._halt_event.set()
 
 
 __all__ = ["RiskLimits", "SymbolLimits"]
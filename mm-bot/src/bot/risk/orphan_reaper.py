@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-import datetime as dt
-from typing import Dict
+import time
+from typing import Dict, List
 
 from ..connectors.cex_ccxt import ExchangeConnector
 
@@ -12,19 +12,26 @@ from ..connectors.cex_ccxt import ExchangeConnector
 class OrphanReaper:
     def __init__(self, connector: ExchangeConnector, timeout_seconds: float = 10.0) -> None:
         self._connector = connector
-        self._timeout = timeout_seconds
-        self._timestamps: Dict[str, dt.datetime] = {}
+        self._timeout_ns = int(timeout_seconds * 1e9)
+        self._timestamps: Dict[str, int] = {}
         self._lock = asyncio.Lock()
 
     async def track(self, order_id: str) -> None:
         async with self._lock:
-            self._timestamps[order_id] = dt.datetime.utcnow()
+            self._timestamps[order_id] = time.monotonic_ns()
 
     async def sweep(self) -> None:
-        now = dt.datetime.utcnow()
+        cutoff = time.monotonic_ns() - self._timeout_ns
         async with self._lock:
-            stale = [order_id for order_id, ts in self._timestamps.items() if (now - ts).total_seconds() > self._timeout]
-        for order_id in stale:
-            await self._connector.cancel_order(order_id)
+            stale = [order_id for order_id, ts in self._timestamps.items() if ts < cutoff]
+        if not stale:
+            return
+        cancelled: List[str] = []
+        try:
+            for order_id in stale:
+                await self._connector.cancel_order(order_id)
+                cancelled.append(order_id)
+        finally:
             async with self._lock:
-                self._timestamps.pop(order_id, None)
+                for order_id in cancelled:
+                    self._timestamps.pop(order_id, None)
@@ -0,0 +1,221 @@
+"""Numerical kernels shared by the signal estimators."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from ._njit import njit
+
+# Column layout of the per-symbol top-of-book rows consumed by ``micro_update``.
+BOOK_BID_SIZE = 0
+BOOK_ASK_SIZE = 1
+BOOK_MID = 2
+BOOK_MICROPRICE = 3
+BOOK_QI = 4
+BOOK_COLUMNS = 5
+
+
+def grow_rows(array: np.ndarray, rows: int) -> np.ndarray:
+    """Return ``array`` zero-padded along the first axis to ``rows`` rows."""
+
+    grown = np.zeros((rows,) + array.shape[1:], dtype=array.dtype)
+    grown[: array.shape[0]] = array
+    return grown
+
+
+@njit(cache=True, fastmath=True)
+def ewma_reverse(buf: np.ndarray, head: int, count: int, alpha: float) -> float:
+    """EWMA over the ``count`` newest ring-buffer entries, walking newest to oldest."""
+
+    capacity = buf.shape[0]
+    result = 0.0
+    for i in range(count):
+        result = alpha * buf[(head - 1 - i) % capacity] + (1.0 - alpha) * result
+    return result
+
+
+@njit(cache=True, fastmath=True)
+def impact_update(
+    mean_vol: float,
+    mean_ret: float,
+    lam: float,
+    signed_volume: float,
+    price_return: float,
+    decay: float,
+) -> tuple[float, float, float]:
+    """One decayed update of the (mean volume, mean return, lambda) impact state."""
+
+    keep = 1.0 - decay
+    mean_vol = decay * mean_vol + keep * signed_volume
+    mean_ret = decay * mean_ret + keep * price_return
+    if abs(signed_volume) > 1e-9:
+        lam = decay * lam + keep * (price_return / signed_volume)
+    return mean_vol, mean_ret, lam
+
+
+@njit(cache=True, fastmath=True)
+def book_features(
+    bid_price: float,
+    bid_size: float,
+    ask_price: float,
+    ask_size: float,
+    last_bid_size: float,
+    last_ask_size: float,
+    last_mid: float,
+) -> tuple[float, float, float, float]:
+    """Return ``(mid, microprice, queue_imbalance, ofi_delta)`` for one top-of-book update."""
+
+    mid = (bid_price + ask_price) / 2
+    denom = bid_size + ask_size
+    if denom == 0.0:
+        microprice = mid
+        qi = 0.0
+    else:
+        microprice = (ask_price * bid_size + bid_price * ask_size) / denom
+        qi = (bid_size - ask_size) / denom
+    ofi_delta = (bid_size - last_bid_size) - (ask_size - last_ask_size) + (mid - last_mid)
+    return mid, microprice, qi, ofi_delta
+
+
+@njit(cache=True)
+def ring_push(buf: np.ndarray, head: np.ndarray, count: np.ndarray, row: int, value: float) -> None:
+    """Append ``value`` to ``row`` of a 2-D ring buffer, advancing ``head``/``count`` in place."""
+
+    capacity = buf.shape[1]
+    h = head[row]
+    buf[row, h] = value
+    head[row] = (h + 1) % capacity
+    if count[row] < capacity:
+        count[row] += 1
+
+
+@njit(cache=True)
+def moments_push(
+    buf: np.ndarray,
+    head: np.ndarray,
+    count: np.ndarray,
+    total: np.ndarray,
+    sumsq: np.ndarray,
+    row: int,
+    value: float,
+) -> None:
+    """``ring_push`` that also maintains the running sum and sum of squares of the row."""
+
+    capacity = buf.shape[1]
+    h = head[row]
+    if count[row] == capacity:
+        old = buf[row, h]
+        total[row] -= old
+        sumsq[row] -= old * old
+    else:
+        count[row] += 1
+    buf[row, h] = value
+    total[row] += value
+    sumsq[row] += value * value
+    h = (h + 1) % capacity
+    head[row] = h
+    if h == 0:
+        # Re-anchor the running moments once per lap to stop rounding drift.
+        s = 0.0
+        ss = 0.0
+        for i in range(count[row]):
+            v = buf[row, i]
+            s += v
+            ss += v * v
+        total[row] = s
+        sumsq[row] = ss
+
+
+@njit(cache=True)
+def sample_std(total: float, sumsq: float, n: int) -> float:
+    """Sample standard deviation from running moments; zero for fewer than two samples."""
+
+    if n == 0:
+        return 0.0
+    variance = (sumsq - total * total / n) / max(n - 1, 1)
+    return math.sqrt(variance) if variance > 0.0 else 0.0
+
+
+@njit(cache=True, fastmath=True)
+def micro_update(
+    bid_price: float,
+    bid_size: float,
+    ask_price: float,
+    ask_size: float,
+    row: int,
+    book: np.ndarray,
+    has_book: np.ndarray,
+    ofi_buf: np.ndarray,
+    ofi_head: np.ndarray,
+    ofi_count: np.ndarray,
+    alpha: float,
+) -> tuple[float, float, float]:
+    """Advance one symbol's book/OFI state and return ``(microprice, queue_imbalance, ofi)``."""
+
+    state = book[row]
+    if has_book[row]:
+        mid, microprice, qi, ofi_delta = book_features(
+            bid_price,
+            bid_size,
+            ask_price,
+            ask_size,
+            state[BOOK_BID_SIZE],
+            state[BOOK_ASK_SIZE],
+            state[BOOK_MID],
+        )
+        ring_push(ofi_buf, ofi_head, ofi_count, row, ofi_delta)
+        ofi = ewma_reverse(ofi_buf[row], ofi_head[row], ofi_count[row], alpha)
+    else:
+        mid, microprice, qi, _ = book_features(
+            bid_price, bid_size, ask_price, ask_size, 0.0, 0.0, 0.0
+        )
+        # No previous book: report the latest raw OFI entry (e.g. from trades), if any.
+        ofi = ofi_buf[row, ofi_head[row] - 1] if ofi_count[row] > 0 else 0.0
+        has_book[row] = True
+    state[BOOK_BID_SIZE] = bid_size
+    state[BOOK_ASK_SIZE] = ask_size
+    state[BOOK_MID] = mid
+    state[BOOK_MICROPRICE] = microprice
+    state[BOOK_QI] = qi
+    return microprice, qi, ofi
+
+
+@njit(cache=True)
+def vol_update(
+    mid: float,
+    row: int,
+    ret_buf: np.ndarray,
+    ret_head: np.ndarray,
+    ret_count: np.ndarray,
+    ret_sum: np.ndarray,
+    ret_sumsq: np.ndarray,
+    last_mid: np.ndarray,
+) -> float:
+    """Push the return since the previous mid for ``row`` and return the updated sigma."""
+
+    last = last_mid[row]
+    if last > 0.0:
+        moments_push(ret_buf, ret_head, ret_count, ret_sum, ret_sumsq, row, (mid - last) / last)
+    last_mid[row] = mid
+    return sample_std(ret_sum[row], ret_sumsq[row], ret_count[row])
+
+
+__all__ = [
+    "BOOK_ASK_SIZE",
+    "BOOK_BID_SIZE",
+    "BOOK_COLUMNS",
+    "BOOK_MICROPRICE",
+    "BOOK_MID",
+    "BOOK_QI",
+    "book_features",
+    "ewma_reverse",
+    "grow_rows",
+    "impact_update",
+    "micro_update",
+    "moments_push",
+    "ring_push",
+    "sample_std",
+    "vol_update",
+]
@@ -0,0 +1,41 @@
+"""Optional numba ``njit`` decorator with a pure-Python fallback."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, TypeVar, overload
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+try:  # pragma: no cover - optional dependency for tests
+    # The pre-commit mypy env has no numba; where it is installed it ships its own types.
+    from numba import njit as _numba_njit  # type: ignore[import-not-found, unused-ignore]
+
+    NUMBA_AVAILABLE = True
+except ModuleNotFoundError:  # pragma: no cover - optional dependency missing
+    _numba_njit = None  # type: ignore[assignment, unused-ignore]
+    NUMBA_AVAILABLE = False
+
+
+@overload
+def njit(func: F, /) -> F: ...
+
+
+@overload
+def njit(*, cache: bool = ..., fastmath: bool = ...) -> Callable[[F], F]: ...
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Compile with ``numba.njit`` when available, otherwise return the function unchanged."""
+
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: F) -> F:
+        return func
+
+    return decorator
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit"]
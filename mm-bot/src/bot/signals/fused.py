@@ -0,0 +1,107 @@
+"""Fused per-snapshot update of microstructure and volatility features."""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from ..core.types import OrderBookSnapshot
+from ._kernels import BOOK_MID, micro_update, vol_update
+from ._njit import njit
+from .microstructure import MicrostructureFeature, MicrostructureSignals
+from .volatility import VolatilityEstimator
+
+
+@njit(cache=True)
+def compute_all(
+    bid_price: float,
+    bid_size: float,
+    ask_price: float,
+    ask_size: float,
+    micro_row: int,
+    book: np.ndarray,
+    has_book: np.ndarray,
+    ofi_buf: np.ndarray,
+    ofi_head: np.ndarray,
+    ofi_count: np.ndarray,
+    ofi_alpha: float,
+    vol_row: int,
+    ret_buf: np.ndarray,
+    ret_head: np.ndarray,
+    ret_count: np.ndarray,
+    ret_sum: np.ndarray,
+    ret_sumsq: np.ndarray,
+    last_mid: np.ndarray,
+) -> tuple[float, float, float, float]:
+    """Return ``(microprice, queue_imbalance, ofi, sigma)`` after one top-of-book update."""
+
+    microprice, qi, ofi = micro_update(
+        bid_price,
+        bid_size,
+        ask_price,
+        ask_size,
+        micro_row,
+        book,
+        has_book,
+        ofi_buf,
+        ofi_head,
+        ofi_count,
+        ofi_alpha,
+    )
+    sigma = vol_update(
+        book[micro_row, BOOK_MID],
+        vol_row,
+        ret_buf,
+        ret_head,
+        ret_count,
+        ret_sum,
+        ret_sumsq,
+        last_mid,
+    )
+    return microprice, qi, ofi, sigma
+
+
+class SnapshotFeatures:
+    """Update microstructure and volatility state with one kernel call per snapshot.
+
+    Equivalent to calling ``micro.update_snapshot`` followed by ``vol.update``; both
+    estimators keep serving ``get``/``sigma`` reads as usual.
+    """
+
+    def __init__(self, micro: MicrostructureSignals, vol: VolatilityEstimator) -> None:
+        self._micro = micro
+        self._vol = vol
+
+    def update_snapshot(self, snapshot: OrderBookSnapshot) -> Tuple[MicrostructureFeature, float]:
+        bid = snapshot.bid
+        ask = snapshot.ask
+        micro = self._micro.kernel_state(snapshot.symbol)
+        vol = self._vol.kernel_state(snapshot.symbol)
+        microprice, qi, ofi, sigma = compute_all(
+            bid.price,
+            bid.size,
+            ask.price,
+            ask.size,
+            micro.row,
+            micro.book,
+            micro.has_book,
+            micro.ofi_buf,
+            micro.ofi_head,
+            micro.ofi_count,
+            micro.ofi_alpha,
+            vol.row,
+            vol.ret_buf,
+            vol.ret_head,
+            vol.ret_count,
+            vol.ret_sum,
+            vol.ret_sumsq,
+            vol.last_mid,
+        )
+        feature = MicrostructureFeature(
+            microprice=float(microprice), queue_imbalance=float(qi), order_flow_imbalance=float(ofi)
+        )
+        return feature, float(sigma)
+
+
+__all__ = ["SnapshotFeatures", "compute_all"]
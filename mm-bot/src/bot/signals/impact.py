@@ -2,27 +2,62 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Optional
 
+import numpy as np
+
+from ..core.symbol_table import SymbolTable
 from ..core.types import Trade
+from ._kernels import grow_rows, impact_update
 
 
 class ImpactEstimator:
-    def __init__(self, decay: float = 0.99) -> None:
+    def __init__(
+        self,
+        decay: float = 0.99,
+        capacity: int = 8,
+        symbols: Optional[SymbolTable] = None,
+    ) -> None:
         self._decay = decay
-        self._state: Dict[str, tuple[float, float, float]] = {}
-        # state: (mean_volume, mean_return, lambda_estimate)
+        # Structure-of-arrays state indexed by a per-symbol integer id.
+        self._symbols = symbols if symbols is not None else SymbolTable()
+        self._mean_vol = np.zeros(capacity, dtype=np.float64)
+        self._mean_ret = np.zeros(capacity, dtype=np.float64)
+        self._lam = np.zeros(capacity, dtype=np.float64)
+
+    def register_symbol(self, symbol: str) -> None:
+        """Allocate state for ``symbol`` up front so the first update does not have to."""
+
+        self._row(symbol)
 
     def update(self, trade: Trade, price_return: float) -> float:
-        key = trade.symbol
-        mean_vol, mean_ret, lam = self._state.get(key, (0.0, 0.0, 0.0))
-        signed_volume = trade.size if trade.side.value == "buy" else -trade.size
-        mean_vol = self._decay * mean_vol + (1 - self._decay) * signed_volume
-        mean_ret = self._decay * mean_ret + (1 - self._decay) * price_return
-        if abs(signed_volume) > 1e-9:
-            lam = self._decay * lam + (1 - self._decay) * (price_return / signed_volume)
-        self._state[key] = (mean_vol, mean_ret, lam)
-        return lam
+        idx = self._row(trade.symbol)
+        signed_volume = trade.size * trade.side.sign
+        mean_vol, mean_ret, lam = impact_update(
+            self._mean_vol[idx],
+            self._mean_ret[idx],
+            self._lam[idx],
+            signed_volume,
+            price_return,
+            self._decay,
+        )
+        self._mean_vol[idx] = mean_vol
+        self._mean_ret[idx] = mean_ret
+        self._lam[idx] = lam
+        return float(lam)
 
     def get(self, symbol: str) -> float:
-        return self._state.get(symbol, (0.0, 0.0, 0.0))[2]
+        idx = self._symbols.get(symbol)
+        if idx is None or idx >= self._lam.shape[0]:
+            return 0.0
+        return float(self._lam[idx])
+
+    def _row(self, symbol: str) -> int:
+        idx = self._symbols.intern(symbol)
+        capacity = self._lam.shape[0]
+        if idx >= capacity:
+            size = max(2 * capacity, idx + 1)
+            self._mean_vol = grow_rows(self._mean_vol, size)
+            self._mean_ret = grow_rows(self._mean_ret, size)
+            self._lam = grow_rows(self._lam, size)
+        return idx
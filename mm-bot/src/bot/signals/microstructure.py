@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
-import collections
 from dataclasses import dataclass
-from typing import Deque, Dict, Optional
+from typing import NamedTuple, Optional
 
+import numpy as np
+
+from ..core.symbol_table import SymbolTable
 from ..core.types import OrderBookSnapshot, Trade
+from ._kernels import (
+    BOOK_COLUMNS,
+    BOOK_MICROPRICE,
+    BOOK_QI,
+    ewma_reverse,
+    grow_rows,
+    micro_update,
+    ring_push,
+)
 
 
 @dataclass
@@ -16,64 +27,113 @@ class MicrostructureFeature:
     order_flow_imbalance: float
 
 
+class MicroKernelState(NamedTuple):
+    """One symbol's row and the state arrays ``micro_update`` advances."""
+
+    row: int
+    book: np.ndarray
+    has_book: np.ndarray
+    ofi_buf: np.ndarray
+    ofi_head: np.ndarray
+    ofi_count: np.ndarray
+    ofi_alpha: float
+
+
 class MicrostructureSignals:
-    def __init__(self, ofi_window: int = 20, ofi_alpha: float = 0.3) -> None:
-        self._last_snapshot: Dict[str, OrderBookSnapshot] = {}
-        self._ofi_history: Dict[str, Deque[float]] = collections.defaultdict(lambda: collections.deque(maxlen=ofi_window))
+    def __init__(
+        self,
+        ofi_window: int = 20,
+        ofi_alpha: float = 0.3,
+        capacity: int = 8,
+        symbols: Optional[SymbolTable] = None,
+    ) -> None:
+        self._ofi_window = ofi_window
         self._ofi_alpha = ofi_alpha
+        # Per-symbol state lives in rows of parallel arrays indexed by the symbol id:
+        # the last top-of-book (see ``BOOK_*`` columns) and an OFI ring buffer where
+        # ``head`` is the next write slot and ``count`` the number of valid entries.
+        self._symbols = symbols if symbols is not None else SymbolTable()
+        self._book = np.zeros((capacity, BOOK_COLUMNS), dtype=np.float64)
+        self._has_book = np.zeros(capacity, dtype=np.bool_)
+        self._ofi_buf = np.zeros((capacity, ofi_window), dtype=np.float64)
+        self._ofi_head = np.zeros(capacity, dtype=np.int64)
+        self._ofi_count = np.zeros(capacity, dtype=np.int64)
+
+    def register_symbol(self, symbol: str) -> None:
+        """Allocate state for ``symbol`` up front so the first update does not have to."""
+
+        self._row(symbol)
 
     def update_snapshot(self, snapshot: OrderBookSnapshot) -> MicrostructureFeature:
-        microprice = self._compute_microprice(snapshot)
-        qi = self._compute_qi(snapshot)
-        last = self._last_snapshot.get(snapshot.symbol)
-        ofi = self._ofi_history[snapshot.symbol][-1] if self._ofi_history[snapshot.symbol] else 0.0
-        if last is not None:
-            ofi_delta = self._compute_ofi(last, snapshot)
-            self._ofi_history[snapshot.symbol].append(ofi_delta)
-            ofi = self._ewma(self._ofi_history[snapshot.symbol])
-        self._last_snapshot[snapshot.symbol] = snapshot
-        return MicrostructureFeature(microprice=microprice, queue_imbalance=qi, order_flow_imbalance=ofi)
+        bid = snapshot.bid
+        ask = snapshot.ask
+        state = self.kernel_state(snapshot.symbol)
+        microprice, qi, ofi = micro_update(
+            bid.price,
+            bid.size,
+            ask.price,
+            ask.size,
+            state.row,
+            state.book,
+            state.has_book,
+            state.ofi_buf,
+            state.ofi_head,
+            state.ofi_count,
+            state.ofi_alpha,
+        )
+        return MicrostructureFeature(
+            microprice=float(microprice), queue_imbalance=float(qi), order_flow_imbalance=float(ofi)
+        )
 
     def update_trade(self, trade: Trade) -> None:
         # Could be extended to incorporate trade imbalance; for now store placeholder.
-        history = self._ofi_history[trade.symbol]
-        signed_size = trade.size if trade.side.value == "buy" else -trade.size
-        history.append(signed_size)
+        row = self._row(trade.symbol)
+        ring_push(self._ofi_buf, self._ofi_head, self._ofi_count, row, trade.size * trade.side.sign)
 
     def get(self, symbol: str) -> Optional[MicrostructureFeature]:
-        snapshot = self._last_snapshot.get(symbol)
-        if snapshot is None:
+        row = self._symbols.get(symbol)
+        if row is None or row >= self._has_book.shape[0] or not self._has_book[row]:
             return None
-        microprice = self._compute_microprice(snapshot)
-        qi = self._compute_qi(snapshot)
-        ofi = self._ewma(self._ofi_history[symbol]) if self._ofi_history[symbol] else 0.0
-        return MicrostructureFeature(microprice=microprice, queue_imbalance=qi, order_flow_imbalance=ofi)
-
-    def _compute_microprice(self, snapshot: OrderBookSnapshot) -> float:
-        bid_contrib = snapshot.ask.price * snapshot.bid.size
-        ask_contrib = snapshot.bid.price * snapshot.ask.size
-        denom = snapshot.bid.size + snapshot.ask.size
-        if denom == 0:
-            return snapshot.mid
-        return (bid_contrib + ask_contrib) / denom
-
-    def _compute_qi(self, snapshot: OrderBookSnapshot) -> float:
-        denom = snapshot.bid.size + snapshot.ask.size
-        if denom == 0:
+        book = self._book[row]
+        return MicrostructureFeature(
+            microprice=float(book[BOOK_MICROPRICE]),
+            queue_imbalance=float(book[BOOK_QI]),
+            order_flow_imbalance=self._ewma(row),
+        )
+
+    def kernel_state(self, symbol: str) -> MicroKernelState:
+        """State for driving ``micro_update`` on ``symbol`` directly (see ``SnapshotFeatures``).
+
+        The row is resolved first because registering a symbol may reallocate the arrays,
+        so use the returned arrays straight away rather than holding on to them.
+        """
+
+        row = self._row(symbol)
+        return MicroKernelState(
+            row=row,
+            book=self._book,
+            has_book=self._has_book,
+            ofi_buf=self._ofi_buf,
+            ofi_head=self._ofi_head,
+            ofi_count=self._ofi_count,
+            ofi_alpha=self._ofi_alpha,
+        )
+
+    def _ewma(self, row: int) -> float:
+        count = int(self._ofi_count[row])
+        if not count:
             return 0.0
-        return (snapshot.bid.size - snapshot.ask.size) / denom
-
-    def _compute_ofi(self, last: OrderBookSnapshot, current: OrderBookSnapshot) -> float:
-        bid_delta = current.bid.size - last.bid.size
-        ask_delta = current.ask.size - last.ask.size
-        price_move = current.mid - last.mid
-        return bid_delta - ask_delta + price_move
-
-    def _ewma(self, values: Deque[float]) -> float:
-        weight = 0.0
-        result = 0.0
-        alpha = self._ofi_alpha
-        for value in reversed(values):
-            result = alpha * value + (1 - alpha) * result
-            weight = alpha + (1 - alpha) * weight
-        return result if weight else 0.0
+        head = int(self._ofi_head[row])
+        return float(ewma_reverse(self._ofi_buf[row], head, count, self._ofi_alpha))
+
+    def _row(self, symbol: str) -> int:
+        row = self._symbols.intern(symbol)
+        capacity = self._has_book.shape[0]
+        if row >= capacity:
+            size = max(2 * capacity, row + 1)
+            self._book = grow_rows(self._book, size)
+            self._has_book = grow_rows(self._has_book, size)
+            self._ofi_buf = grow_rows(self._ofi_buf, size)
+            self._ofi_head = grow_rows(self._ofi_head, size)
+            self._ofi_count = grow_rows(self._ofi_count, size)
+        return row
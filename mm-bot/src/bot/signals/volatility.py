@@ -2,31 +2,97 @@
 
 from __future__ import annotations
 
-import collections
-import math
-from typing import Deque, Dict
+from typing import NamedTuple, Optional
 
+import numpy as np
+
+from ..core.symbol_table import SymbolTable
 from ..core.types import OrderBookSnapshot
+from ._kernels import grow_rows, sample_std, vol_update
+
+
+class VolKernelState(NamedTuple):
+    """One symbol's row and the state arrays ``vol_update`` advances."""
+
+    row: int
+    ret_buf: np.ndarray
+    ret_head: np.ndarray
+    ret_count: np.ndarray
+    ret_sum: np.ndarray
+    ret_sumsq: np.ndarray
+    last_mid: np.ndarray
 
 
 class VolatilityEstimator:
-    def __init__(self, window: int = 100) -> None:
-        self._returns: Dict[str, Deque[float]] = collections.defaultdict(lambda: collections.deque(maxlen=window))
-        self._last_mid: Dict[str, float] = {}
+    def __init__(
+        self,
+        window: int = 100,
+        capacity: int = 8,
+        symbols: Optional[SymbolTable] = None,
+    ) -> None:
+        # Returns live in a fixed-size ring buffer row per symbol alongside running
+        # sum / sum-of-squares so ``sigma`` is O(1). A last mid of 0.0 means "none yet".
+        self._window = window
+        self._symbols = symbols if symbols is not None else SymbolTable()
+        self._buf = np.zeros((capacity, window), dtype=np.float64)
+        self._head = np.zeros(capacity, dtype=np.int64)
+        self._count = np.zeros(capacity, dtype=np.int64)
+        self._sum = np.zeros(capacity, dtype=np.float64)
+        self._sumsq = np.zeros(capacity, dtype=np.float64)
+        self._last_mid = np.zeros(capacity, dtype=np.float64)
+
+    def register_symbol(self, symbol: str) -> None:
+        """Allocate state for ``symbol`` up front so the first update does not have to."""
+
+        self._row(symbol)
 
     def update(self, snapshot: OrderBookSnapshot) -> float:
-        mid = snapshot.mid
-        last = self._last_mid.get(snapshot.symbol)
-        if last is not None and last > 0:
-            ret = (mid - last) / last
-            self._returns[snapshot.symbol].append(ret)
-        self._last_mid[snapshot.symbol] = mid
-        return self.sigma(snapshot.symbol)
+        state = self.kernel_state(snapshot.symbol)
+        sigma = vol_update(
+            snapshot.mid,
+            state.row,
+            state.ret_buf,
+            state.ret_head,
+            state.ret_count,
+            state.ret_sum,
+            state.ret_sumsq,
+            state.last_mid,
+        )
+        return float(sigma)
 
     def sigma(self, symbol: str) -> float:
-        returns = self._returns.get(symbol)
-        if not returns:
+        row = self._symbols.get(symbol)
+        if row is None or row >= self._count.shape[0]:
             return 0.0
-        mean = sum(returns) / len(returns)
-        variance = sum((r - mean) ** 2 for r in returns) / max(len(returns) - 1, 1)
-        return math.sqrt(variance)
+        return float(sample_std(self._sum[row], self._sumsq[row], int(self._count[row])))
+
+    def kernel_state(self, symbol: str) -> VolKernelState:
+        """State for driving ``vol_update`` on ``symbol`` directly (see ``SnapshotFeatures``).
+
+        The row is resolved first because registering a symbol may reallocate the arrays,
+        so use the returned arrays straight away rather than holding on to them.
+        """
+
+        row = self._row(symbol)
+        return VolKernelState(
+            row=row,
+            ret_buf=self._buf,
+            ret_head=self._head,
+            ret_count=self._count,
+            ret_sum=self._sum,
+            ret_sumsq=self._sumsq,
+            last_mid=self._last_mid,
+        )
+
+    def _row(self, symbol: str) -> int:
+        row = self._symbols.intern(symbol)
+        capacity = self._head.shape[0]
+        if row >= capacity:
+            size = max(2 * capacity, row + 1)
+            self._buf = grow_rows(self._buf, size)
+            self._head = grow_rows(self._head, size)
+            self._count = grow_rows(self._count, size)
+            self._sum = grow_rows(self._sum, size)
+            self._sumsq = grow_rows(self._sumsq, size)
+            self._last_mid = grow_rows(self._last_mid, size)
+        return row
@@ -0,0 +1,56 @@
+"""Compile (or load from cache) the signal kernels before the first live tick."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+from ..core.types import OrderBookLevel, OrderBookSnapshot, Side, Trade
+from .fused import SnapshotFeatures
+from .impact import ImpactEstimator
+from .microstructure import MicrostructureSignals
+from .volatility import VolatilityEstimator
+
+_WARMUP_SYMBOL = "__warmup__"
+
+
+def warmup() -> None:
+    """Drive every kernel once through throwaway estimators.
+
+    Going through the public estimator methods makes numba specialise on exactly the
+    argument types seen in production, so the live loop never hits a compile. Without
+    numba this just runs a few pure-Python updates.
+    """
+
+    micro = MicrostructureSignals(capacity=1)
+    vol = VolatilityEstimator(capacity=1)
+    impact = ImpactEstimator(capacity=1)
+    features = SnapshotFeatures(micro, vol)
+    now = dt.datetime.utcnow()
+    for mid in (100.0, 100.5):
+        snapshot = OrderBookSnapshot(
+            venue="warmup",
+            symbol=_WARMUP_SYMBOL,
+            timestamp=now,
+            bid=OrderBookLevel(price=mid - 0.5, size=1.0),
+            ask=OrderBookLevel(price=mid + 0.5, size=1.0),
+            last_trade_price=mid,
+            last_trade_size=1.0,
+        )
+        micro.update_snapshot(snapshot)
+        vol.update(snapshot)
+        features.update_snapshot(snapshot)
+    trade = Trade(
+        venue="warmup",
+        symbol=_WARMUP_SYMBOL,
+        timestamp=now,
+        price=100.5,
+        size=1.0,
+        side=Side.BUY,
+    )
+    micro.update_trade(trade)
+    impact.update(trade, 0.005)
+    micro.get(_WARMUP_SYMBOL)
+    vol.sigma(_WARMUP_SYMBOL)
+
+
+__all__ = ["warmup"]
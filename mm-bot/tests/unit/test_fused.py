@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import datetime as dt
+import math
+import random
+
+from bot.core.types import OrderBookLevel, OrderBookSnapshot, Side, Trade
+from bot.signals.fused import SnapshotFeatures
+from bot.signals.microstructure import MicrostructureSignals
+from bot.signals.volatility import VolatilityEstimator
+
+
+def test_fused_update_matches_separate_estimators() -> None:
+    rng = random.Random(11)
+    micro_a = MicrostructureSignals(ofi_window=5, capacity=2)
+    vol_a = VolatilityEstimator(window=6, capacity=2)
+    micro_b = MicrostructureSignals(ofi_window=5, capacity=2)
+    vol_b = VolatilityEstimator(window=6, capacity=2)
+    fused = SnapshotFeatures(micro_b, vol_b)
+    symbols = [f"SYM{i}" for i in range(5)]
+    mids = {symbol: 100.0 + i for i, symbol in enumerate(symbols)}
+    for _ in range(400):
+        symbol = rng.choice(symbols)
+        if rng.random() < 0.3:
+            trade = Trade(
+                venue="test",
+                symbol=symbol,
+                timestamp=dt.datetime.utcnow(),
+                price=mids[symbol],
+                size=rng.uniform(0.01, 1.0),
+                side=rng.choice([Side.BUY, Side.SELL]),
+            )
+            micro_a.update_trade(trade)
+            micro_b.update_trade(trade)
+            continue
+        mids[symbol] += rng.uniform(-0.5, 0.5)
+        snapshot = OrderBookSnapshot(
+            venue="test",
+            symbol=symbol,
+            timestamp=dt.datetime.utcnow(),
+            bid=OrderBookLevel(price=mids[symbol] - 0.05, size=rng.uniform(0.0, 2.0)),
+            ask=OrderBookLevel(price=mids[symbol] + 0.05, size=rng.uniform(0.0, 2.0)),
+            last_trade_price=mids[symbol],
+            last_trade_size=1.0,
+        )
+        expected = micro_a.update_snapshot(snapshot)
+        expected_sigma = vol_a.update(snapshot)
+        feature, sigma = fused.update_snapshot(snapshot)
+        assert math.isclose(feature.microprice, expected.microprice, rel_tol=1e-9)
+        assert math.isclose(
+            feature.queue_imbalance, expected.queue_imbalance, rel_tol=1e-9, abs_tol=1e-12
+        )
+        assert math.isclose(
+            feature.order_flow_imbalance, expected.order_flow_imbalance, rel_tol=1e-9, abs_tol=1e-12
+        )
+        assert math.isclose(sigma, expected_sigma, rel_tol=1e-9, abs_tol=1e-15)
+    for symbol in symbols:
+        assert math.isclose(vol_b.sigma(symbol), vol_a.sigma(symbol), rel_tol=1e-9, abs_tol=1e-15)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import collections
 import datetime as dt
+import math
 
 from bot.core.types import OrderBookLevel, OrderBookSnapshot, Side, Trade
 from bot.signals.microstructure import MicrostructureSignals
@@ -42,3 +44,30 @@ def test_order_flow_updates_with_trades() -> None:
     signals.update_trade(trade)
     feature = signals.get("BTC-PERP")
     assert feature is not None
+
+
+def test_ofi_ewma_matches_deque_reference_after_wraparound() -> None:
+    window, alpha = 4, 0.3
+    signals = MicrostructureSignals(ofi_window=window, ofi_alpha=alpha)
+    signals.update_snapshot(make_snapshot(100.0, 100.5, 1.0, 1.0))
+    history: collections.deque[float] = collections.deque(maxlen=window)
+    for i in range(10):
+        size = 0.1 * (i + 1)
+        side = Side.BUY if i % 3 else Side.SELL
+        signals.update_trade(
+            Trade(
+                venue="test",
+                symbol="BTC-PERP",
+                timestamp=dt.datetime.utcnow(),
+                price=100.25,
+                size=size,
+                side=side,
+            )
+        )
+        history.append(size if side is Side.BUY else -size)
+    expected = 0.0
+    for value in reversed(history):
+        expected = alpha * value + (1 - alpha) * expected
+    feature = signals.get("BTC-PERP")
+    assert feature is not None
+    assert math.isclose(feature.order_flow_imbalance, expected, rel_tol=1e-12)
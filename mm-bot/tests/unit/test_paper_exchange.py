@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import asyncio
+
+from bot.connectors.cex_ccxt import PaperExchange
+from bot.core.types import Order, Side
+
+
+def test_paper_exchange_places_and_fills_order() -> None:
+    async def scenario() -> None:
+        exchange = PaperExchange(fee_rate=0.0)
+        order = Order(venue="v", symbol="BTC", side=Side.BUY, price=100.0, size=0.5)
+        order_id = await exchange.place_order(order)
+        states = await exchange.list_orders("BTC")
+        assert [state.order.order_id for state in states] == [order_id]
+        await exchange.process_cross("BTC", bid=99.0, ask=100.0)
+        fill = await exchange.poll_fills()
+        assert fill is not None
+        assert fill.order_id == order_id
+        assert fill.size == 0.5
+
+    asyncio.run(scenario())
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import datetime as dt
+import itertools
+import math
+from typing import Dict, List, Optional
+
+import pytest
+
+from bot.connectors.cex_ccxt import OrderState
+from bot.core.types import Fill, Order, OrderBookLevel, OrderBookSnapshot, Side, Trade
+from bot.data.feeds import InMemoryFeedStore
+from bot.data.storage import StorageBackend
+from bot.hedge.hedger import HedgePolicy, Hedger
+from bot.mm.quoter import Quoter
+from bot.models.avellaneda_stoikov import AvellanedaStoikovModel, QuoteResult
+from bot.risk.kill_switch import KillSwitch
+from bot.risk.limits import RiskLimits, SymbolLimits
+from bot.risk.orphan_reaper import OrphanReaper
+from bot.signals.impact import ImpactEstimator
+from bot.signals.microstructure import MicrostructureSignals
+from bot.signals.volatility import VolatilityEstimator
+
+
+class StubConnector:
+    """Records order traffic and lets tests inject fills and venue-side removals."""
+
+    def __init__(self) -> None:
+        self.orders: Dict[str, OrderState] = {}
+        self.fills: List[Fill] = []
+        self.cancelled: List[str] = []
+        self.reject_cancel: Optional[str] = None
+        self._ids = itertools.count(1)
+
+    def register_symbol(self, symbol: str) -> None:
+        pass
+
+    async def place_order(self, order: Order) -> str:
+        order_id = f"o{next(self._ids)}"
+        listed = dataclasses.replace(order, order_id=order_id)
+        self.orders[order_id] = OrderState(order=listed, remaining=order.size)
+        return order_id
+
+    async def cancel_order(self, order_id: str, symbol: Optional[str] = None) -> None:
+        if order_id == self.reject_cancel:
+            raise RuntimeError("cancel rejected")
+        self.cancelled.append(order_id)
+        self.orders.pop(order_id, None)
+
+    async def list_open_orders(self, symbol: Optional[str] = None) -> List[OrderState]:
+        return list(self.orders.values())
+
+    async def process_cross(self, symbol: str, bid: float, ask: float) -> None:
+        pass
+
+    async def poll_fill(self) -> Optional[Fill]:
+        return self.fills.pop(0) if self.fills else None
+
+
+class NullStorage(StorageBackend):
+    async def record_snapshot(self, snapshot: OrderBookSnapshot) -> None:
+        pass
+
+    async def record_trade(self, trade: Trade) -> None:
+        pass
+
+
+class FailingReaper:
+    async def track(self, order_id: str) -> None:
+        pass
+
+    async def sweep(self) -> None:
+        raise RuntimeError("order not found")
+
+
+def make_quoter(connector: StubConnector, **kwargs: object) -> Quoter:
+    risk = RiskLimits(
+        {"BTC": SymbolLimits(max_position=10.0, max_order_notional=1_000_000.0)},
+        max_drawdown=1e9,
+        max_daily_loss=1e9,
+        max_inventory_notional=1e9,
+    )
+    options: Dict[str, object] = dict(
+        store=InMemoryFeedStore(),
+        connector=connector,
+        model=AvellanedaStoikovModel(
+            gamma=0.1, horizon=60.0, kappa=1.5, min_spread=0.5, skew_alpha=0.0
+        ),
+        risk=risk,
+        micro=MicrostructureSignals(),
+        vol=VolatilityEstimator(),
+        impact=ImpactEstimator(),
+        hedger=Hedger(connector, HedgePolicy(enabled=False, threshold=1.0, max_notional=0.0)),
+        orphan=OrphanReaper(connector),
+        storage=NullStorage(),
+        refresh=0.01,
+        lot_size=0.1,
+        tick_size=0.5,
+        venue="v",
+        symbol="BTC",
+        orphan_interval=0.0,
+    )
+    options.update(kwargs)
+    return Quoter(**options)
+
+
+def test_orphan_sweep_failures_trip_kill_switch() -> None:
+    async def scenario() -> None:
+        triggered: List[str] = []
+
+        async def on_trigger(reason: str) -> None:
+            triggered.append(reason)
+
+        kill_switch = KillSwitch(threshold=3, on_trigger=on_trigger)
+        quoter = make_quoter(StubConnector(), orphan=FailingReaper(), kill_switch=kill_switch)
+        quoter._running = True
+        loop_task = asyncio.create_task(quoter._orphan_loop())
+        await asyncio.wait_for(kill_switch.wait_tripped(), timeout=1.0)
+        await quoter.stop()
+        await loop_task
+        assert triggered == ["order not found"]
+
+    asyncio.run(scenario())
+
+
+def make_snapshot(mid: float = 100.0) -> OrderBookSnapshot:
+    return OrderBookSnapshot(
+        venue="v",
+        symbol="BTC",
+        timestamp=dt.datetime.utcnow(),
+        bid=OrderBookLevel(price=mid - 0.5, size=1.0),
+        ask=OrderBookLevel(price=mid + 0.5, size=1.0),
+        last_trade_price=mid,
+        last_trade_size=1.0,
+    )
+
+
+def make_fill(state: OrderState, size: float) -> Fill:
+    order = state.order
+    assert order.order_id is not None
+    return Fill(
+        order_id=order.order_id,
+        venue=order.venue,
+        symbol=order.symbol,
+        side=order.side,
+        price=order.price,
+        size=size,
+        fee=0.0,
+        timestamp=dt.datetime.utcnow(),
+    )
+
+
+def test_replace_orders_keeps_close_quotes_and_requotes_moved_side() -> None:
+    async def scenario() -> None:
+        connector = StubConnector()
+        quoter = make_quoter(connector)
+        await quoter._replace_orders(QuoteResult(bid=99.0, ask=101.0, spread=2.0))
+        first = dict(quoter._state.open_orders)
+        assert set(connector.orders) == {"o1", "o2"}
+        # Bid moves by less than half a tick, ask by a full tick.
+        await quoter._replace_orders(QuoteResult(bid=99.2, ask=101.5, spread=2.3))
+        open_orders = quoter._state.open_orders
+        assert open_orders[Side.BUY] is first[Side.BUY]
+        assert connector.cancelled == ["o2"]
+        assert open_orders[Side.SELL].order.order_id == "o3"
+        assert open_orders[Side.SELL].order.price == 101.5
+
+    asyncio.run(scenario())
+
+
+def test_failed_cancel_keeps_order_tracked_until_it_succeeds() -> None:
+    async def scenario() -> None:
+        connector = StubConnector()
+        quoter = make_quoter(connector)
+        await quoter._replace_orders(QuoteResult(bid=99.0, ask=101.0, spread=2.0))
+        ask = quoter._state.open_orders[Side.SELL]
+        connector.reject_cancel = "o2"
+        with pytest.raises(RuntimeError):
+            await quoter._replace_orders(QuoteResult(bid=99.0, ask=102.0, spread=3.0))
+        assert quoter._state.open_orders[Side.SELL] is ask
+        assert set(connector.orders) == {"o1", "o2"}
+        connector.reject_cancel = None
+        await quoter._replace_orders(QuoteResult(bid=99.0, ask=102.0, spread=3.0))
+        assert connector.cancelled == ["o2"]
+        assert quoter._state.open_orders[Side.SELL].order.order_id == "o3"
+
+    asyncio.run(scenario())
+
+
+def test_sync_cancels_untracked_live_orders() -> None:
+    async def scenario() -> None:
+        connector = StubConnector()
+        quoter = make_quoter(connector)
+        await quoter._replace_orders(QuoteResult(bid=99.0, ask=101.0, spread=2.0))
+        stray = Order(venue="v", symbol="BTC", side=Side.SELL, price=101.5, size=0.1)
+        stray_id = await connector.place_order(stray)
+        await quoter._sync_open_orders()
+        assert connector.cancelled == [stray_id]
+        assert set(connector.orders) == {"o1", "o2"}
+        tracked = {state.order.order_id for state in quoter._state.open_orders.values()}
+        assert tracked == {"o1", "o2"}
+
+    asyncio.run(scenario())
+
+
+def test_drain_fills_tracks_partial_and_full_fills() -> None:
+    async def scenario() -> None:
+        connector = StubConnector()
+        quoter = make_quoter(connector)
+        await quoter._replace_orders(QuoteResult(bid=99.0, ask=101.0, spread=2.0))
+        bid = quoter._state.open_orders[Side.BUY]
+        connector.fills.append(make_fill(bid, 0.04))
+        await quoter._drain_fills(make_snapshot())
+        assert quoter._state.open_orders[Side.BUY] is bid
+        assert math.isclose(bid.remaining, 0.06)
+        assert math.isclose(quoter._state.inventory, 0.04)
+        connector.fills.append(make_fill(bid, 0.06))
+        await quoter._drain_fills(make_snapshot())
+        assert Side.BUY not in quoter._state.open_orders
+        assert Side.SELL in quoter._state.open_orders
+        assert math.isclose(quoter._state.inventory, 0.1)
+        # The freed side is quoted again on the next refresh.
+        await quoter._replace_orders(QuoteResult(bid=99.0, ask=101.0, spread=2.0))
+        assert quoter._state.open_orders[Side.BUY].order.order_id == "o3"
+        assert connector.cancelled == []
+
+    asyncio.run(scenario())
+
+
+def test_sync_drops_orders_removed_at_venue_despite_failing_sweep() -> None:
+    async def scenario() -> None:
+        connector = StubConnector()
+        quoter = make_quoter(connector, orphan=FailingReaper())
+        await quoter._replace_orders(QuoteResult(bid=99.0, ask=101.0, spread=2.0))
+        # e.g. filled via a fill the hedger consumed from the shared queue
+        del connector.orders["o1"]
+        quoter._running = True
+        loop_task = asyncio.create_task(quoter._orphan_loop())
+        for _ in range(100):
+            if Side.BUY not in quoter._state.open_orders:
+                break
+            await asyncio.sleep(0)
+        await quoter.stop()
+        await loop_task
+        assert Side.BUY not in quoter._state.open_orders
+        assert quoter._state.open_orders[Side.SELL].order.order_id == "o2"
+
+    asyncio.run(scenario())
+
+
+def test_risk_halt_interrupts_refresh_sleep_and_cancels_orders() -> None:
+    async def scenario() -> None:
+        connector = StubConnector()
+        store = InMemoryFeedStore()
+        micro = MicrostructureSignals()
+        snapshot = make_snapshot()
+        await store.update_snapshot(snapshot)
+        micro.update_snapshot(snapshot)
+        quoter = make_quoter(connector, store=store, micro=micro, refresh=60.0)
+        task = asyncio.create_task(quoter.start())
+        for _ in range(100):
+            if connector.orders:
+                break
+            await asyncio.sleep(0)
+        assert len(connector.orders) == 2
+        quoter._risk._halt("test halt")
+        # Well under the 60s refresh; the risk halt path itself pauses for 1s.
+        await asyncio.wait_for(task, timeout=3.0)
+        assert connector.orders == {}
+        assert sorted(connector.cancelled) == ["o1", "o2"]
+
+    asyncio.run(scenario())
+
+
+def test_kill_switch_reset_before_halt_is_handled_keeps_quoting() -> None:
+    async def on_trigger(reason: str) -> None:
+        pass
+
+    async def scenario() -> None:
+        connector = StubConnector()
+        store = InMemoryFeedStore()
+        micro = MicrostructureSignals()
+        snapshot = make_snapshot()
+        await store.update_snapshot(snapshot)
+        micro.update_snapshot(snapshot)
+        kill_switch = KillSwitch(threshold=1, on_trigger=on_trigger)
+        quoter = make_quoter(
+            connector, store=store, micro=micro, refresh=60.0, kill_switch=kill_switch
+        )
+        task = asyncio.create_task(quoter.start())
+        for _ in range(100):
+            if connector.orders:
+                break
+            await asyncio.sleep(0)
+        # Let the halt watcher start waiting, then trip and reset without yielding in
+        # between, so the loop only sees a finished watcher and a clear kill switch.
+        await asyncio.sleep(0.01)
+        await kill_switch.record_error("blip")
+        await kill_switch.reset()
+        await asyncio.sleep(0.05)
+        assert not task.done()
+        assert set(connector.orders) == {"o1", "o2"}
+        # The re-armed watcher still reacts to the next trip.
+        await kill_switch.record_error("real")
+        await asyncio.wait_for(task, timeout=1.0)
+        assert connector.orders == {}
+
+    asyncio.run(scenario())
@@ -4,7 +4,7 @@ import asyncio
 
 from bot.core.types import Order, Side
 from bot.risk.kill_switch import KillSwitch
-from bot.risk.limits import RiskLimits, SymbolLimits
+from bot.risk.limits import RiskLimits, SymbolLimits, _CancelWindow
 
 
 def test_risk_limits_blocks_excess_inventory() -> None:
@@ -19,6 +19,23 @@ def test_risk_limits_blocks_excess_inventory() -> None:
     assert not limits.check_order(order)
 
 
+def test_risk_limits_rejects_zero_and_nan_price_orders() -> None:
+    limits = RiskLimits(
+        {"BTC": SymbolLimits(max_position=1.0, max_order_notional=1000.0)},
+        max_drawdown=100.0,
+        max_daily_loss=100.0,
+        max_inventory_notional=1000.0,
+    )
+    assert limits.check_order(Order(venue="v", symbol="BTC", side=Side.BUY, price=100.0, size=0.1))
+    assert not limits.check_order(
+        Order(venue="v", symbol="BTC", side=Side.BUY, price=0.0, size=0.1)
+    )
+    assert not limits.check_order(
+        Order(venue="v", symbol="BTC", side=Side.SELL, price=float("nan"), size=0.1)
+    )
+    assert not limits.halted
+
+
 def test_kill_switch_triggers() -> None:
     triggered: list[str] = []
 
@@ -31,3 +48,96 @@ def test_kill_switch_triggers() -> None:
     assert triggered == []
     asyncio.run(ks.record_error("second"))
     assert triggered == ["second"]
+
+
+def test_kill_switch_reset_clears_tripped_event() -> None:
+    async def on_trigger(reason: str) -> None:
+        pass
+
+    async def scenario() -> None:
+        ks = KillSwitch(threshold=1, on_trigger=on_trigger)
+        await ks.record_error("boom")
+        await asyncio.wait_for(ks.wait_tripped(), timeout=1.0)
+        await ks.reset()
+        assert not ks.tripped
+        waiter = asyncio.create_task(ks.wait_tripped())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await ks.record_error("again")
+        await asyncio.wait_for(waiter, timeout=1.0)
+
+    asyncio.run(scenario())
+
+
+def test_risk_limits_halts_on_cancel_rate() -> None:
+    limits = RiskLimits(
+        {
+            "BTC": SymbolLimits(
+                max_position=1.0, max_order_notional=1000.0, max_cancels_per_minute=2
+            )
+        },
+        max_drawdown=100.0,
+        max_daily_loss=100.0,
+        max_inventory_notional=1000.0,
+    )
+    order = Order(venue="v", symbol="BTC", side=Side.BUY, price=100.0, size=0.1)
+    limits.record_cancel("BTC")
+    assert limits.check_order(order)
+    limits.record_cancel("BTC")
+    assert not limits.check_order(order)
+    assert limits.halted
+
+
+def test_risk_limits_halts_on_total_inventory_notional() -> None:
+    limits = RiskLimits(
+        {
+            "BTC": SymbolLimits(max_position=10.0, max_order_notional=1000.0),
+            "ETH": SymbolLimits(max_position=10.0, max_order_notional=1000.0),
+        },
+        max_drawdown=100.0,
+        max_daily_loss=100.0,
+        max_inventory_notional=1000.0,
+    )
+    limits.update_mid("BTC", 100.0)
+    limits.update_mid("ETH", 50.0)
+    limits.update_inventory("BTC", 4.0)
+    limits.update_inventory("ETH", -8.0)
+    limits.update_inventory("BTC", 5.0)
+    assert not limits.halted
+    limits.update_mid("ETH", 70.0)
+    assert limits.halted
+
+
+def test_cancel_window_prunes_across_wraparound() -> None:
+    window = _CancelWindow(capacity=4)
+    for ts in (10, 20, 30):
+        window.append(ts)
+    assert window.prune(15) == 2
+    # Head wraps past the end and overwrites 20; live span is slots 2..3 then 0..1.
+    for ts in (40, 50, 60):
+        window.append(ts)
+    assert len(window) == 4
+    assert window.prune(45) == 2
+    assert window.prune(61) == 0
+    assert window.prune(100) == 0
+
+
+def test_cancel_window_overwrites_oldest_when_full() -> None:
+    window = _CancelWindow(capacity=3)
+    for ts in range(1, 8):
+        window.append(ts)
+    assert len(window) == 3
+    assert window.prune(0) == 3
+    assert window.prune(6) == 2
+
+
+def test_cancel_window_keeps_timestamps_equal_to_cutoff() -> None:
+    window = _CancelWindow(capacity=4)
+    for ts in (5, 5, 7, 7):
+        window.append(ts)
+    assert window.prune(5) == 4
+    assert window.prune(6) == 2
+    window.append(9)
+    window.append(9)
+    assert window.prune(7) == 4
+    assert window.prune(9) == 2
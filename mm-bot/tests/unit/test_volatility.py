@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import datetime as dt
+import math
+import random
+import statistics
+
+from bot.core.symbol_table import SymbolTable
+from bot.core.types import OrderBookLevel, OrderBookSnapshot
+from bot.signals.volatility import VolatilityEstimator
+
+
+def make_snapshot(mid: float) -> OrderBookSnapshot:
+    return OrderBookSnapshot(
+        venue="test",
+        symbol="BTC-PERP",
+        timestamp=dt.datetime.utcnow(),
+        bid=OrderBookLevel(price=mid - 0.5, size=1.0),
+        ask=OrderBookLevel(price=mid + 0.5, size=1.0),
+        last_trade_price=mid,
+        last_trade_size=1.0,
+    )
+
+
+def test_sigma_matches_sample_stdev_over_rolling_window() -> None:
+    rng = random.Random(7)
+    window = 16
+    estimator = VolatilityEstimator(window=window)
+    mids = [30000.0]
+    for _ in range(3 * window + 5):
+        mids.append(mids[-1] + rng.uniform(-5.0, 5.0))
+    for mid in mids:
+        estimator.update(make_snapshot(mid))
+    returns = [(b - a) / a for a, b in zip(mids[:-1], mids[1:], strict=True)][-window:]
+    assert math.isclose(estimator.sigma("BTC-PERP"), statistics.stdev(returns), rel_tol=1e-6)
+
+
+def test_sigma_is_zero_without_history() -> None:
+    estimator = VolatilityEstimator()
+    assert estimator.sigma("BTC-PERP") == 0.0
+    estimator.update(make_snapshot(100.0))
+    estimator.update(make_snapshot(101.0))
+    assert estimator.sigma("BTC-PERP") == 0.0
+
+
+def test_shared_symbol_table_ids_beyond_capacity() -> None:
+    symbols = SymbolTable()
+    for name in ("A", "B", "C"):
+        symbols.intern(name)
+    estimator = VolatilityEstimator(window=4, capacity=1, symbols=symbols)
+    assert estimator.sigma("BTC-PERP") == 0.0
+    for mid in (100.0, 101.0, 100.0):
+        estimator.update(make_snapshot(mid))
+    assert symbols.get("BTC-PERP") == 3
+    assert estimator.sigma("BTC-PERP") > 0.0
+    assert estimator.sigma("C") == 0.0